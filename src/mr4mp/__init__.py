@@ -1,2 +1,2 @@
 """Gives users direct access to class and functions."""
-from mr4mp.mr4mp import pool, mapreduce, mapconcat
+from mr4mp.mr4mp import pool, mapreduce, mapconcat, configure, shutdown, merge_dict_of_sets
@@ -3,22 +3,283 @@ Thin MapReduce-like layer that wraps the Python multiprocessing
 library.
 """
 from __future__ import annotations
-from typing import Any, Optional, Callable, Sequence, Iterable
+from typing import Any, Optional, Callable, Sequence, Iterable, Iterator, Tuple, List
+import os
 import doctest
+import atexit
+import threading
+import collections
 import collections.abc
+import pickle
 import multiprocessing
-from operator import concat
-from functools import reduce, partial
+import multiprocessing.reduction
+from operator import concat, add, or_
+from functools import reduce, partial, lru_cache
+from itertools import chain
 import parts
 
-def _parts(xs: Iterable, quantity: int) -> Sequence:
+try:
+    from multiprocessing import shared_memory, resource_tracker
+except ImportError: # pragma: no cover
+    shared_memory = None # Shared memory is only available in Python 3.8 and higher.
+
+class _lazy(collections.abc.Iterable): # pylint: disable=invalid-name,too-few-public-methods
+    """
+    Iterable that obtains a new iterator from the supplied function each time
+    it is iterated over.
+    """
+    def __init__(self: _lazy, iterator: Callable[[], Iterator]):
+        self._iterator = iterator
+
+    def __iter__(self: _lazy) -> Iterator:
+        return iter(self._iterator())
+
+class _lazy_sized( # pylint: disable=invalid-name,too-few-public-methods
+        _lazy, collections.abc.Sized
+    ):
+    """
+    Lazy iterable (see :obj:`_lazy`) for which the number of items that will
+    be yielded is known in advance.
+    """
+    def __init__(self: _lazy_sized, iterator: Callable[[], Iterator], length: int):
+        super().__init__(iterator)
+        self._length = length
+
+    def __len__(self: _lazy_sized) -> int:
+        return self._length
+
+def _parts(xs: Iterable, quantity: int) -> Iterable:
+    """
+    Wrapper for the partitioning function :obj:`~parts.parts.parts` that yields
+    the parts lazily. When the original input iterable is
+    :obj:`~collections.abc.Sized`, so is the result (its length is the number
+    of parts that will be yielded), making it possible for a progress wrapper
+    to determine the total without materializing all of the parts.
+
+    >>> xss = _parts(range(7), 3)
+    >>> len(xss)
+    3
+    >>> [list(xs) for xs in xss]
+    [[0, 1], [2, 3], [4, 5, 6]]
+    >>> len(_parts(range(2), 3))
+    2
+    >>> isinstance(_parts(iter(range(7)), 3), collections.abc.Sized)
+    False
+    """
+    iterator = partial(parts.parts, xs, quantity)
+    if isinstance(xs, collections.abc.Sized):
+        return _lazy_sized(iterator, min(len(xs), quantity))
+
+    return _lazy(iterator)
+
+# Bulk equivalents of folds that use common operations (keyed by the identifier
+# of the operation and by the type of every item being combined).
+_folds: dict = {
+    (id(concat), list): lambda xs: list(chain.from_iterable(xs)),
+    (id(concat), tuple): lambda xs: tuple(chain.from_iterable(xs)),
+    (id(concat), str): ''.join,
+    (id(concat), bytes): b''.join,
+    (id(add), list): lambda xs: list(chain.from_iterable(xs)),
+    (id(add), tuple): lambda xs: tuple(chain.from_iterable(xs)),
+    (id(add), str): ''.join,
+    (id(add), bytes): b''.join,
+    (id(add), int): sum,
+    (id(or_), set): lambda xs: set().union(*xs),
+    (id(or_), frozenset): lambda xs: frozenset().union(*xs)
+}
+_fold_operations: frozenset = frozenset(key for (key, _) in _folds)
+
+def _fold(op: Callable, xs: Iterable) -> Any:
+    """
+    Combine the items in an iterable using the supplied binary operation. For
+    some common operations, a bulk equivalent is used if all items have the
+    same built-in type (*e.g.*, lists are concatenated in linear rather than
+    quadratic time).
+
+    >>> _fold(concat, [[1], [2, 3], [4]])
+    [1, 2, 3, 4]
+    >>> _fold(or_, [{1}, {2}, {1, 3}])
+    {1, 2, 3}
+    >>> _fold(add, [1, 2.0, 3])
+    6.0
+
+    A bulk equivalent is available for each of these operations (so that, for
+    example, concatenating many lists takes linear time).
+
+    >>> all(id(op) in _fold_operations for op in (concat, add, or_))
+    True
+    >>> len(_fold(concat, [[i] for i in range(100000)]))
+    100000
+    """
+    if id(op) in _fold_operations:
+        xs = list(xs)
+        if len(xs) > 0:
+            # Instances of subclasses may override the operation, so types must match exactly.
+            type_ = type(xs[0])
+            fold = _folds.get((id(op), type_))
+            # pylint: disable=unidiomatic-typecheck
+            if fold is not None and all(type(x) is type_ for x in xs):
+                return fold(xs)
+
+    return reduce(op, xs)
+
+@lru_cache(maxsize=None)
+def _cpu_count_system() -> int: # pragma: no cover
+    """
+    Return the number of CPUs in the system (this cannot change while this
+    process is running, so it is computed once and then reused).
+    """
+    return multiprocessing.cpu_count()
+
+def _cpu_count() -> int:
+    """
+    Return the number of CPUs that this process is allowed to use (which may
+    be fewer than the number of CPUs in the system, such as within containers
+    or when the process is restricted to a subset of CPUs). The CPUs that this
+    process is allowed to use can change while it is running, so they are
+    determined anew each time (only the number of CPUs in the system, used on
+    platforms that do not support CPU affinity, is computed once and reused).
+
+    >>> 0 < _cpu_count() <= multiprocessing.cpu_count()
+    True
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+
+    return _cpu_count_system() # pragma: no cover
+
+def _sliceable(xs: Iterable) -> bool:
+    """
+    Determine whether the supplied iterable can be split into parts by slicing
+    it (some sequences, such as :obj:`~collections.deque` instances, support
+    indexing but not slicing).
+
+    >>> _sliceable(range(3))
+    True
+    >>> _sliceable(collections.deque(range(3)))
+    False
+    >>> _sliceable({0: 1, 1: 2})
+    False
+    """
+    if not isinstance(xs, collections.abc.Sized) or \
+       isinstance(xs, collections.abc.Mapping):
+        return False
+
+    try:
+        xs[0:0]
+    except (TypeError, KeyError, IndexError, ValueError):
+        return False
+
+    return True
+
+def _buffer(xs: Iterable) -> Optional[memoryview]:
+    """
+    Return a one-dimensional contiguous :obj:`memoryview` of the supplied
+    iterable if it supports the buffer protocol (and ``None`` otherwise).
+
+    >>> from array import array
+    >>> _buffer(array('l', [1, 2, 3])).tolist()
+    [1, 2, 3]
+    >>> _buffer([1, 2, 3]) is None
+    True
+    """
+    # Some exporters refuse to expose their buffer (*e.g.*, NumPy arrays of dates
+    # raise a :obj:`ValueError`), in which case the input is not shared.
+    try:
+        view = memoryview(xs)
+    except (TypeError, ValueError, BufferError):
+        return None
+
+    if view.ndim != 1 or not view.c_contiguous or len(view) == 0:
+        return None
+
+    # Workers must be able to interpret the shared bytes using the item format.
+    try:
+        with view.cast('B') as bytes_, bytes_.cast(view.format):
+            return view
+    except (TypeError, ValueError):
+        return None
+
+# Most recently received serialized operations and their deserialized
+# counterparts (maintained separately within each worker process).
+_operations: tuple = (None, None)
+
+def _deserialize_operations(operations: bytes) -> tuple:
     """
-    Wrapper for the partitioning function :obj:`~parts.parts.parts`. This
-    wrapper returns a :obj:`~collections.abc.Sized` list of parts if the
-    original input iterable is :obj:`~collections.abc.Sized`.
+    Deserialize the map and reduce operations (and the flag indicating whether
+    the map operation is vectorized), reusing the operations from the most
+    recent invocation if they have not changed. This ensures that each worker
+    deserializes the operations at most once per workflow (rather than once
+    per part).
+
+    >>> from operator import add
+    >>> _deserialize_operations(_serialize_operations(abs, add, False))
+    (<built-in function abs>, <built-in function add>, False)
     """
-    xss = parts.parts(xs, quantity)
-    return list(xss) if isinstance(xss, collections.abc.Sized) else xss
+    global _operations # pylint: disable=global-statement
+    if _operations[0] != operations:
+        _operations = (operations, pickle.loads(operations))
+
+    return _operations[1]
+
+def _serialize_operations(m: Callable, r: Callable, vectorize: bool) -> bytes:
+    """
+    Serialize the map and reduce operations once so that they can be included
+    in every task without being serialized again for each part.
+    """
+    return bytes(multiprocessing.reduction.ForkingPickler.dumps((m, r, vectorize)))
+
+def _apply(m: Callable, r: Callable, vectorize: bool, part: Iterable) -> Any:
+    """
+    Apply the map operation to the items in a part and combine the results
+    using the reduce operation (or, if the map operation is vectorized, apply
+    it to the part as a whole).
+
+    >>> from operator import add
+    >>> _apply(abs, add, False, [-1, 2, -3])
+    6
+    >>> _apply(sum, add, True, [-1, 2, -3])
+    -2
+    """
+    return m(part) if vectorize else _fold(r, map(m, part))
+
+def _map_reduce_part(operations: bytes, part: Iterable) -> Any:
+    """
+    Apply the operations to a part using :obj:`_apply`.
+    """
+    return _apply(*_deserialize_operations(operations), part)
+
+def _map_reduce_shared(operations: bytes, name: str, fmt: str, indices: range) -> Any:
+    """
+    Attach to the shared memory block having the supplied name and apply
+    :obj:`_map_reduce_part` to the part of the block specified by the range
+    of indices.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        with shm.buf.cast(fmt) as items, items[indices.start:indices.stop] as part:
+            return _map_reduce_part(operations, part)
+    finally:
+        shm.close()
+
+def _reduce_pair(operations: bytes, pair: tuple) -> Any:
+    """
+    Combine a pair of per-part results using the reduce operation.
+    """
+    (_, op_reduce, _) = _deserialize_operations(operations)
+    return op_reduce(*pair)
+
+def _pin(cpus: tuple, counter: Any):
+    """
+    Restrict the worker process in which this function is invoked to a single
+    CPU from the supplied collection (chosen using a counter shared by the
+    workers in a pool so that they are spread across the CPUs).
+    """
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+
+    os.sched_setaffinity(0, {cpus[index % len(cpus)]})
 
 class pool:
     """
@@ -29,6 +290,33 @@ class pool:
     :param stages: Number of stages (progress updates are provided once per stage).
     :param progress: Function that wraps an iterable (can be used to also report progress).
     :param close: Flag indicating whether this instance should be closed after one workflow.
+    :param shared: Flag indicating whether inputs that support the buffer protocol should be
+        copied once into shared memory (rather than being pickled part by part).
+    :param tree: Flag indicating whether per-part results should be combined by workers in
+        rounds of pairs (*i.e.*, using a tree reduction) rather than one at a time by this
+        instance's process.
+    :param batch_size: Target number of items in each part of the input (by default, the
+        input is split into four parts per process); parts are handed out to workers in clumps
+        to amortize communication overhead when items are numerous and inexpensive to process.
+    :param min_parallel: Minimum number of items an input must have for its processing to be
+        distributed across processes (smaller inputs are processed within this instance's
+        process to avoid the overhead of communicating with workers); by default, only inputs
+        that have at most one item are processed within this instance's process.
+    :param start_method: Method used to start worker processes (by default, the default
+        method of the :obj:`multiprocessing` library for the platform and Python version is
+        used); ``'fork'`` starts workers most quickly (as modules need not be imported anew
+        within each worker), but it is unsafe if this process is running multiple threads
+        (as it is whenever another pool instance is open), which is why it is not the default
+        on macOS or, starting with Python 3.14, on any platform.
+    :param vectorize: Flag indicating whether the map operation should be applied to each
+        part of the input as a whole (*e.g.*, to slices of a NumPy array) rather than to
+        each individual item; the results for the parts are combined using the reduce
+        operation.
+    :param chunksize: Number of parts handed to a worker at a time (by default, this is
+        chosen so that each worker receives about four clumps of parts).
+    :param pin: Flag indicating whether each worker process should be restricted to one of
+        the CPUs available to this process (so that data used by a worker stays in the cache
+        of that CPU); this has no effect on platforms that do not support CPU affinity.
 
     >>> from operator import inv, add
     >>> with pool() as pool_:
@@ -36,12 +324,21 @@ class pool:
     ...     results
     -6
     """
-    def __init__(
+    # pylint: disable=too-many-instance-attributes
+    def __init__( # pylint: disable=too-many-arguments
             self: pool,
             processes: Optional[int] = None,
             stages: Optional[int] = None,
             progress: Optional[Callable[[Iterable], Iterable]] = None,
-            close: Optional[bool] = False
+            close: Optional[bool] = False,
+            shared: Optional[bool] = False,
+            tree: Optional[bool] = False,
+            batch_size: Optional[int] = None,
+            min_parallel: Optional[int] = 2,
+            start_method: Optional[str] = None,
+            vectorize: Optional[bool] = False,
+            chunksize: Optional[int] = None,
+            pin: Optional[bool] = False
         ):
         """
         Initialize a :obj:`pool` instance given the target number of processes.
@@ -50,19 +347,42 @@ class pool:
         # If a negative number of processes is designated, wrap around
         # and subtract from the maximum.
         if isinstance(processes, int) and processes <= 0:
-            processes = multiprocessing.cpu_count() + processes
+            processes = _cpu_count() + processes
         elif processes is None:
-            processes = multiprocessing.cpu_count()
+            processes = _cpu_count()
 
         # Only create a multiprocessing pool if necessary.
         if processes != 1:
-            # pylint: disable=consider-using-with
-            self._pool = multiprocessing.Pool(processes=processes)
+            # Workers that attach to shared memory blocks must share the resource
+            # tracker of this process (so that only this process unlinks blocks).
+            # Shared memory blocks are not tracked on Windows (where they are
+            # released once no process has a handle to them).
+            if shared and shared_memory is not None and os.name == 'posix':
+                resource_tracker.ensure_running()
+
+            # Each worker restricts itself to one CPU when it starts (if so directed).
+            pin = pin and hasattr(os, 'sched_setaffinity')
+
+            context = multiprocessing.get_context(start_method)
+            self._pool = context.Pool( # pylint: disable=consider-using-with
+                processes=processes,
+                initializer=_pin if pin else None,
+                initargs=(
+                    (tuple(sorted(os.sched_getaffinity(0))), context.Value('i', 0))
+                    if pin else ()
+                )
+            )
 
         self._processes = processes
         self._stages = stages
         self._progress = progress
         self._close = close # Indicates whether to close pool after first ``mapreduce`` call.
+        self._shared = shared and shared_memory is not None
+        self._tree = tree
+        self._batch_size = batch_size
+        self._min_parallel = min_parallel
+        self._vectorize = vectorize
+        self._chunksize = chunksize
         self._closed = False
         self._terminated = False
 
@@ -78,34 +398,176 @@ class pool:
         """
         self.close()
 
-    def _map(self: pool, op: Callable, xs: Iterable):
+    def _imap(self: pool, op: Callable, xs: Sequence, ordered: bool = True) -> Iterable:
         """
-        Split data (one part per process) and map the operation
-        onto each part.
+        Split data (by default, into four parts per process so that a worker
+        that finishes its parts early can take on parts that would otherwise
+        have gone to a slower worker) and apply the operation to each part
+        within a worker, returning the results as they become available (in
+        the order of the parts, if so directed).
         """
-        if self._processes == 1:
-            return [[op(x) for x in xs]]
+        if self._batch_size is not None:
+            quantity = max(len(self), -(-len(xs) // self._batch_size))
+        else:
+            quantity = 4 * len(self)
 
-        return self._pool.map(partial(map, op), parts.parts(xs, len(self)))
+        # When there are many parts, hand them out to workers in clumps.
+        chunksize = self._chunksize
+        if chunksize is None:
+            chunksize = max(1, quantity // (4 * len(self)))
+
+        return (self._pool.imap if ordered else self._pool.imap_unordered)(
+            op, parts.parts(xs, quantity), chunksize=chunksize
+        )
 
-    def _reduce(self: pool, op: Callable, xs_per_part: Iterable):
+    def _submit(
+            self: pool, m: Callable, r: Callable, xs: Iterable, ordered: bool = True
+        ) -> Tuple[Callable[[], Any], Optional[Callable[[], None]]]:
         """
-        Apply the specified binary operator to the results
-        obtained from multiple processes.
+        Split data into parts and submit them to workers (which apply the map
+        and reduce operations to each part), returning a function that combines
+        the per-part results as they arrive (while any remaining parts are still
+        being processed) and then returns the overall result. A function that
+        releases any resources held by the submitted work (without waiting for
+        or computing its result) is also returned if there are any such resources
+        (and ``None`` is returned in its place otherwise).
         """
-        if self._processes == 1 and len(xs_per_part) == 1:
-            return reduce(op, map(partial(reduce, op), xs_per_part))
-
-        return reduce(op, self._pool.map(partial(reduce, op), xs_per_part))
+        if self._processes == 1:
+            return (partial(_apply, m, r, self._vectorize, xs), None)
+
+        # Inputs that cannot be split into slices (*e.g.*, generators, sets, or
+        # deques) are materialized once so that parts can be created without
+        # further copying.
+        if not _sliceable(xs):
+            xs = list(xs)
+
+        if self._min_parallel is not None and len(xs) < self._min_parallel:
+            return (partial(_apply, m, r, self._vectorize, xs), None)
+
+        operations = _serialize_operations(m, r, self._vectorize)
+        view = _buffer(xs) if self._shared else None
+        if view is None:
+            return (partial(self._reduce, operations, r, self._imap(
+                partial(_map_reduce_part, operations),
+                xs,
+                ordered
+            )), None)
+
+        # Copy the buffer into a shared memory block once; workers receive only
+        # the name of the block and the range of indices for their part.
+        shm = shared_memory.SharedMemory(create=True, size=view.nbytes)
+
+        # On POSIX platforms, a block can be unlinked while workers are attached
+        # to it (workers that have not yet attached to it fail to do so).
+        def release():
+            shm.close()
+            shm.unlink()
+
+        try:
+            with view.cast('B') as bytes_:
+                shm.buf[:view.nbytes] = bytes_
+            results = self._imap(
+                partial(_map_reduce_shared, operations, shm.name, view.format),
+                range(len(view)),
+                ordered
+            )
+        except:
+            release()
+            raise
+
+        def result():
+            try:
+                return self._reduce(operations, r, results)
+            finally:
+                release()
+
+        return (result, release)
+
+    def _map_reduce(self: pool, m: Callable, r: Callable, xs: Iterable, ordered: bool = True):
+        """
+        Apply the map and reduce operations to the data and return the result.
+        """
+        (result, _) = self._submit(m, r, xs, ordered)
+        return result()
 
-    def mapreduce(
+    def _map_reduce_stages( # pylint: disable=too-many-arguments
+            self: pool,
+            m: Callable,
+            r: Callable,
+            xss: Iterable,
+            ordered: bool = True,
+            progress: Optional[Callable[[Iterable], Iterable]] = None
+        ) -> Iterable:
+        """
+        Apply the map and reduce operations to each stage of the data and yield
+        the result of each stage in order. Each stage is submitted to workers
+        before the result of the preceding stage is combined (so at most two
+        stages are in progress at any point).
+
+        If a ``progress`` function is supplied, it wraps an iterable of the stages
+        that yields each stage only once the result for that stage is available
+        (so progress is reported once per completed stage). If any stage fails,
+        the resources held by the stage that is still pending are released (but
+        its result is neither awaited nor computed) before the exception is
+        re-raised.
+        """
+        stages = iter(xss)
+        pending = collections.deque()
+        completed = collections.deque()
+
+        def submit():
+            for xs_ in stages:
+                pending.append((xs_, *self._submit(m, r, xs_, ordered)))
+                break
+
+        def stages_completed():
+            submit()
+            while len(pending) > 0:
+                submit()
+                (xs_, result, _) = pending.popleft()
+                completed.append(result())
+                yield xs_
+
+        xss_ = (
+            _lazy_sized(stages_completed, len(xss))
+            if isinstance(xss, collections.abc.Sized) else
+            _lazy(stages_completed)
+        )
+        try:
+            for _ in (progress(xss_) if progress is not None else xss_):
+                yield completed.popleft()
+        finally:
+            for (_, _, release) in pending:
+                if release is not None:
+                    release()
+
+    def _reduce(self: pool, operations: bytes, op: Callable, results: Iterable):
+        """
+        Apply the specified binary operator to the per-part results
+        obtained from multiple processes.
+        """
+        if self._tree:
+            # Combine adjacent pairs of results within workers in rounds (carrying
+            # over any unpaired result) until only one pair remains.
+            results = list(results)
+            while len(results) > 2:
+                pairs = list(zip(results[0::2], results[1::2]))
+                results = self._pool.map(
+                    partial(_reduce_pair, operations),
+                    pairs
+                ) + results[2 * len(pairs):]
+
+        return _fold(op, results)
+
+    def mapreduce( # pylint: disable=too-many-arguments
             self: pool,
             m: Callable[..., Any],
             r: Callable[..., Any],
             xs: Iterable,
             stages: Optional[int] = None,
             progress: Optional[Callable[[Iterable], Iterable]] = None,
-            close: Optional[bool] = None
+            close: Optional[bool] = None,
+            ordered: bool = True
         ):
         """
         Perform the map operation ``m`` and the reduce operation ``r`` over the
@@ -118,6 +580,8 @@ class pool:
         :param stages: Number of stages (progress updates are provided once per stage).
         :param progress: Function that wraps an iterable (can be used to also report progress).
         :param close: Flag indicating whether this instance should be closed after one workflow.
+        :param ordered: Flag indicating whether results for parts of the input must be combined
+            in the order of the parts.
 
         The ``stages``, ``progress``, and ``close`` parameter values each revert by
         default to those of this :obj:`pool` instance if they are not explicitly
@@ -129,6 +593,15 @@ class pool:
         >>> with pool() as pool_:
         ...     pool_.mapreduce(m=inv, r=add, xs=range(3))
         -6
+
+        If the reduce operation ``r`` is commutative (as well as associative), the
+        results for the parts of the input can be combined as soon as each becomes
+        available (so a part that takes longer to process does not delay the
+        combination of the results for the parts that follow it).
+
+        >>> with pool() as pool_:
+        ...     pool_.mapreduce(m=inv, r=add, xs=range(3), ordered=False)
+        -6
         """
         # A :obj:`ValueError` is returned to maintain consistency with the
         # behavior of the underlying :obj:`multiprocessing` ``Pool`` object.
@@ -143,16 +616,23 @@ class pool:
         close = self._close if close is None else close
 
         if stages is None:
-            result = self._reduce(r, self._map(m, xs))
+            result = self._map_reduce(m, r, xs, ordered)
         else:
             # Separate input into specified number of stages.
             xss = _parts(xs, stages)
 
-            # Perform each stage sequentially.
+            # Perform the stages in order. Results of operations that have a bulk
+            # equivalent are combined once after all stages are complete.
             result = None
-            for xs_ in (progress(xss) if progress is not None else xss):
-                result_stage = self._reduce(r, self._map(m, xs_))
-                result = result_stage if result is None else r(result, result_stage)
+            results = []
+            for result_stage in self._map_reduce_stages(m, r, xss, ordered, progress):
+                if id(r) in _fold_operations:
+                    results.append(result_stage)
+                else:
+                    result = result_stage if result is None else r(result, result_stage)
+
+            if len(results) > 0:
+                result = _fold(r, results)
 
         # Release resources if directed to do so.
         if close:
@@ -195,6 +675,55 @@ class pool:
         """
         return self.mapreduce(m, concat, xs, stages, progress, close)
 
+    def mapreduce_many(
+            self: pool,
+            workflows: Iterable[Tuple[Callable, Callable, Iterable]],
+            close: Optional[bool] = None,
+            ordered: bool = True
+        ) -> List[Any]:
+        """
+        Perform several workflows (each specified by a map operation, a reduce
+        operation, and an input) and return a list of their results. The parts
+        of all the inputs are submitted to the workers before any results are
+        combined, so workers do not sit idle between workflows.
+
+        :param workflows: Iterable of ``(m, r, xs)`` tuples that each specify a workflow.
+        :param close: Flag indicating whether this instance should be closed after the workflows.
+        :param ordered: Flag indicating whether the results for the parts of each input must be
+            combined in order (see :obj:`pool.mapreduce`).
+
+        >>> from operator import inv, add
+        >>> with pool() as pool_:
+        ...     pool_.mapreduce_many([(inv, add, range(3)), (abs, add, range(-2, 3))])
+        [-6, 6]
+        """
+        if self.closed():
+            raise ValueError('Pool not running')
+
+        self._closed = close if close is not None else self._closed
+        close = self._close if close is None else close
+
+        # If any workflow fails, the resources held by every workflow that was
+        # already submitted are released (but the results of those workflows are
+        # neither awaited nor computed) before the exception is re-raised.
+        pending = collections.deque()
+        try:
+            for workflow in workflows:
+                pending.append(self._submit(*workflow, ordered))
+            results = []
+            while len(pending) > 0:
+                (result, _) = pending.popleft()
+                results.append(result())
+        finally:
+            for (_, release) in pending:
+                if release is not None:
+                    release()
+
+        if close:
+            self.close()
+
+        return results
+
     def close(self: pool):
         """
         Prevent any additional work from being added to this instance and
@@ -221,13 +750,10 @@ class pool:
         >>> pool_.closed()
         True
         """
-        if self._processes == 1:
-            return self._closed
-
-        return (
-            self._closed or
-            self._pool._state in ('CLOSE', 'TERMINATE') # pylint: disable=protected-access
-        )
+        # The underlying pool is only ever closed or terminated via the methods of
+        # this instance (which both set this flag), so its private state need not
+        # be inspected.
+        return self._closed
 
     def terminate(self: pool):
         """
@@ -246,13 +772,13 @@ class pool:
 
     def cpu_count(self: pool) -> int:
         """
-        Return number of available CPUs.
+        Return number of CPUs available to this process.
 
         >>> with pool() as pool_:
         ...     isinstance(pool_.cpu_count(), int)
         True
         """
-        return multiprocessing.cpu_count()
+        return _cpu_count()
 
     def __len__(self: pool) -> int:
         """
@@ -265,13 +791,119 @@ class pool:
         """
         return self._processes
 
+def merge_dict_of_sets(d: dict, e: dict) -> dict:
+    """
+    Merge two dictionaries that map keys to sets by adding every entry in the
+    smaller dictionary to the larger dictionary, which is modified in place and
+    then returned. Each merge step requires time proportional only to the size
+    of the smaller dictionary, so this function is well-suited for use as the
+    reduce operation in a workflow that builds an index.
+
+    >>> merge_dict_of_sets({'a': {1}, 'b': {2}}, {'b': {3}, 'c': {4}})
+    {'a': {1}, 'b': {2, 3}, 'c': {4}}
+    >>> merge_dict_of_sets({'b': {3}}, {'a': {1}, 'b': {2}})
+    {'a': {1}, 'b': {2, 3}}
+
+    Because the dictionaries (and the sets within them) may be modified, this
+    function should only be used when the map operation returns new objects
+    that are not referenced elsewhere. In particular, a set from the smaller
+    dictionary that is inserted into the larger dictionary under a new key is
+    not copied, so it may be modified by subsequent merges. Note that whether
+    the results of the map operation are copied when they are sent between
+    processes depends on the number of processes (and on the size of the input),
+    so the map operation should build new sets (rather than returning sets that
+    are found within its input).
+
+    >>> def index(pair):
+    ...     return {pair[0]: {pair[1]}}
+    >>> mapreduce(m=index, r=merge_dict_of_sets, xs=[('a', 1), ('b', 2), ('a', 3)], processes=1)
+    {'a': {1, 3}, 'b': {2}}
+
+    Immutable sets (which the map operation may share across entries) are never
+    modified; the first time such a set is merged, it is replaced with a new
+    mutable set that is modified in place by subsequent merges.
+
+    >>> merge_dict_of_sets({'a': frozenset({1})}, {'a': frozenset({2})})
+    {'a': {1, 2}}
+    """
+    if len(d) < len(e):
+        (d, e) = (e, d)
+
+    for (key, values) in e.items():
+        values_ = d.get(key)
+        if values_ is None:
+            d[key] = values
+        elif isinstance(values_, set):
+            values_ |= values
+        else:
+            d[key] = set().union(values_, values)
+
+    return d
+
+# Configuration of the one-shot functions and the pools (keyed by the number of
+# processes and the vectorization flag) that are reused across their invocations
+# if caching is enabled. The lock ensures that concurrent invocations from
+# multiple threads do not each create a pool for the same key.
+_configuration: dict = {'cache_pool': False}
+_pools: dict = {}
+_pools_lock = threading.Lock()
+
+def shutdown():
+    """
+    Close and discard all pools that were cached for use by the one-shot
+    functions :obj:`mapreduce` and :obj:`mapconcat` (this function is also
+    invoked automatically when the interpreter exits).
+
+    >>> from operator import inv, add
+    >>> configure(cache_pool=True)
+    >>> mapreduce(m=inv, r=add, xs=range(3), processes=2)
+    -6
+    >>> shutdown()
+    >>> mapreduce(m=inv, r=add, xs=range(3), processes=2)
+    -6
+    >>> configure(cache_pool=False)
+    """
+    with _pools_lock:
+        for pool_ in _pools.values():
+            pool_.close()
+        _pools.clear()
+
+atexit.register(shutdown)
+
+def configure(cache_pool: Optional[bool] = None):
+    """
+    Configure the behavior of the one-shot functions :obj:`mapreduce` and
+    :obj:`mapconcat`.
+
+    :param cache_pool: Flag indicating whether a :obj:`pool` instance should be created
+        once (for each number of processes) and reused across invocations.
+
+    When pools are cached, their worker processes are started when they are first
+    used and are closed only when caching is disabled or the interpreter exits.
+    Depending on the start method, worker processes may not have access to any
+    functions that were defined after they were started.
+
+    >>> from operator import inv, add
+    >>> configure(cache_pool=True)
+    >>> mapreduce(m=inv, r=add, xs=range(3), processes=2)
+    -6
+    >>> mapreduce(m=inv, r=add, xs=range(4), processes=2)
+    -10
+    >>> configure(cache_pool=False)
+    """
+    if cache_pool is not None:
+        _configuration['cache_pool'] = cache_pool
+        if not cache_pool:
+            shutdown()
+
 def mapreduce(
         m: Callable[..., Any],
         r: Callable[..., Any],
         xs: Iterable,
         processes: Optional[int] = None,
         stages: Optional[int] = None,
-        progress: Optional[Callable[[Iterable], Iterable]] = None
+        progress: Optional[Callable[[Iterable], Iterable]] = None,
+        vectorize: bool = False
     ):
     """
     One-shot function for performing a workflow (no explicit object
@@ -283,23 +915,43 @@ def mapreduce(
     :param processes: Number of processes to allocate and to employ in executing the workflow.
     :param stages: Number of stages (progress updates are provided once per stage).
     :param progress: Function that wraps an iterable (can be used to also report progress).
+    :param vectorize: Flag indicating whether the map operation should be applied to each
+        part of the input as a whole rather than to each individual item.
 
     >>> from operator import inv, add
     >>> mapreduce(m=inv, r=add, xs=range(3))
     -6
+
+    When the map operation can process an entire sequence at once, the
+    interpreter overhead of applying it to one item at a time can be avoided.
+
+    >>> mapreduce(m=sum, r=add, xs=range(100), processes=1, stages=3, vectorize=True)
+    4950
     """
-    if processes == 1:
+    # Avoid creating a pool if there is at most one item to process.
+    if processes == 1 or (
+        stages is None and isinstance(xs, collections.abc.Sized) and len(xs) < 2
+    ):
         if stages is not None:
             xss = _parts(xs, stages) # Create one part per stage.
-            return reduce(r, [
+            if vectorize:
+                return _fold(r, [m(xs) for xs in (progress(xss) if progress is not None else xss)])
+            return _fold(r, [
                 m(x)
                 for xs in (progress(xss) if progress is not None else xss)
                 for x in xs
             ])
 
-        return reduce(r, [m(x) for x in xs])
+        return m(xs) if vectorize else _fold(r, [m(x) for x in xs])
+
+    if _configuration['cache_pool']:
+        with _pools_lock:
+            pool_ = _pools.get((processes, vectorize))
+            if pool_ is None or pool_.closed():
+                pool_ = _pools[(processes, vectorize)] = pool(processes, vectorize=vectorize)
+        return pool_.mapreduce(m, r, xs, stages=stages, progress=progress, close=False)
 
-    pool_ = pool() if processes is None else pool(processes)
+    pool_ = pool(processes, vectorize=vectorize)
     return pool_.mapreduce(m, r, xs, stages=stages, progress=progress, close=True)
 
 def mapconcat(
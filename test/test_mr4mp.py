@@ -2,11 +2,17 @@
 Test suite containing functional unit tests for the exported class,
 methods, and standalone functions.
 """
+import os
+import ctypes
+import atexit
 from importlib import import_module
 from string import ascii_lowercase
-from hashlib import sha256
-from functools import reduce
-from timeit import default_timer
+from hashlib import sha256, blake2b
+from functools import reduce, lru_cache
+from collections import defaultdict, deque
+from itertools import product, chain
+from operator import add
+from array import array
 import multiprocessing as mp
 from unittest import TestCase
 
@@ -16,7 +22,7 @@ def api_methods():
     """
     API symbols that should be available to users upon module import.
     """
-    return {'pool', 'mapreduce', 'mapconcat'}
+    return {'pool', 'mapreduce', 'mapconcat', 'configure', 'shutdown', 'merge_dict_of_sets'}
 
 class Test_namespace(TestCase):
     """
@@ -28,41 +34,112 @@ class Test_namespace(TestCase):
         module = import_module('mr4mp.mr4mp')
         self.assertTrue(api_methods().issubset(module.__dict__.keys()))
 
+def cpu_count():
+    """Number of CPUs available to the process running the tests."""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return mp.cpu_count()
+
+# Translation table that maps each byte value to one of seven lowercase letters.
+LETTERS = bytes(ord(ascii_lowercase[i % 7]) for i in range(256))
+
 def word(index_doc, index_word):
     """Generate a random (but reproducible) three-character 'word'."""
-    return ''.join(
-        ascii_lowercase[i % 7]
-        for i in sha256((index_doc * index_word).to_bytes(2, 'little')).digest()[:3]
+    return (
+        blake2b((index_doc * index_word).to_bytes(4, 'little'), digest_size=3).digest()
+        .translate(LETTERS).decode('ascii')
     )
 
 def doc(index_doc):
-    """Generate a random (but reproducible) 25-word (or fewer) 'document' and its identifier."""
+    """
+    Generate a random (but reproducible) 'document' (the set of distinct words
+    among 25 generated words) and its identifier.
+    """
     return (
-        [word(index_doc, index_word) for index_word in range(25)],
-        sha256(index_doc.to_bytes(2, 'little')).hexdigest()
+        frozenset(word(index_doc, index_word) for index_word in range(25)),
+        int.from_bytes(sha256(index_doc.to_bytes(4, 'little')).digest()[:8], 'little')
     )
 
+# Number of 'documents' processed by the workflows in the tests (this can be raised
+# using an environment variable so that test durations, such as those reported by
+# ``pytest --durations``, reflect the work performed by the workers rather than the
+# cost of starting and communicating with them).
+DOCS = int(os.environ.get('MR4MP_TEST_DOCS', '50'))
+
+@lru_cache(maxsize=None)
 def docs():
-    """Generate list of 50 random (but reproducible) 'documents'."""
-    return [doc(index_doc) for index_doc in range(50)]
+    """
+    Generate list of random (but reproducible) 'documents' (the list is built
+    once and then shared by all tests, none of which modify it).
+    """
+    return [doc(index_doc) for index_doc in range(DOCS)]
 
 def word_to_doc_id_dict(document):
-    """Build a dictionary mapping the 'words' in a 'document' to its identifier."""
+    """
+    Build a dictionary mapping the 'words' in a 'document' to a set containing its
+    identifier (all entries share one immutable set).
+    """
     (words, identifier) = document
-    return {w: {identifier} for w in set(words)}
+    return dict.fromkeys(words, frozenset((identifier,)))
+
+def word_to_doc_id_dict_at(index_doc):
+    """
+    Build the dictionary for the 'document' having the supplied index (so that
+    only the index must be sent to a worker process).
+    """
+    return word_to_doc_id_dict(doc(index_doc))
 
 def merge_dicts(d, e):
-    """Merge two dictionaries ``d`` and ``e``."""
-    return {w: (d.get(w, set()) | e.get(w, set())) for w in d.keys() | e.keys()}
+    """Merge two dictionaries ``d`` and ``e`` (without modifying either of them)."""
+    merged = dict(d)
+    for (key, ids) in e.items():
+        ids_ = merged.get(key)
+        merged[key] = ids if ids_ is None else ids_ | ids
+    return merged
 
-result_reference = reduce(merge_dicts, map(word_to_doc_id_dict, docs()))
+@lru_cache(maxsize=None)
+def result_reference():
+    """
+    Build the expected index directly (independently of the map and reduce
+    operations used in the tests) by adding each identifier to the sets in
+    one growing dictionary (this is done once, when it is first needed).
+    """
+    index = defaultdict(set)
+    for (words, identifier) in docs():
+        for word_ in words:
+            index[word_].add(identifier)
+    return dict(index)
 
 def add_one(x):
     """
     Simple function defined within module (and not within a method body)
     so that tests that use multiple processes can invoke it.
     """
-    return [x + 1]
+    return (x + 1,)
+
+def abs_nonzero(x):
+    """
+    Absolute value function (defined within module so that tests that use
+    multiple processes can invoke it) that fails on zero.
+    """
+    if x == 0:
+        raise ValueError('zero is not allowed')
+    return abs(x)
+
+def cpus_allowed(_):
+    """
+    Return the number of CPUs that the process invoking this function is allowed
+    to use (defined within module so that tests that use multiple processes can
+    invoke it).
+    """
+    return len(os.sched_getaffinity(0))
+
+def shared_memory_blocks():
+    """Return the number of shared memory blocks (where this can be determined)."""
+    return len(os.listdir('/dev/shm')) if os.path.isdir('/dev/shm') else None
+
+# Expected result of concatenating the outputs of ``add_one`` on ``range(0, 100)``.
+add_one_reference = tuple(range(1, 101))
 
 class log:
     """
@@ -71,16 +148,32 @@ class log:
     """
     # pylint: disable=missing-function-docstring
     def __init__(self):
-        self.logged = []
+        self.logged = ()
 
     def __call__(self, xs):
-        self.logged = list(xs)
+        self.logged = tuple(xs)
         return self.logged
 
     def to_list(self):
-        return [x for xs in self.logged for x in xs]
+        return list(chain.from_iterable(self.logged))
+
+# Pools shared by all tests that do not depend on the closing behavior of a pool
+# (keyed by the number of processes).
+pools = {}
+
+def cached_pool(processes):
+    """Return an open pool (created only if necessary) with the supplied number of processes."""
+    if processes not in pools or pools[processes].closed():
+        pools[processes] = mr4mp.pool(processes)
+    return pools[processes]
 
-def define_class_pool_close(processes):
+@atexit.register
+def close_cached_pools():
+    """Close all pools that were shared by tests."""
+    for pool in pools.values():
+        pool.close()
+
+def define_class_pool_close(processes): # pylint: disable=too-many-statements
     """
     Define and return class of pool unit tests for the supplied pool closing
     behavior configuration.
@@ -89,62 +182,73 @@ def define_class_pool_close(processes):
         """
         Tests of behavior of method that closes an instance.
         """
+        # Number of workflows performed by tests that check that an instance can be
+        # reused (set the ``FULL_TESTS`` environment variable to perform more).
+        REUSE_COUNT = 5 if os.environ.get('FULL_TESTS') else 2
+
         # pylint: disable=missing-function-docstring
         def test_pool_mapreduce_pool_close(self):
             pool = mr4mp.pool(processes, close=True)
             self.assertFalse(pool.closed())
-            print("Starting.")
-            start = default_timer()
-            result = pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs(), close=False)
+            result = pool.mapreduce(word_to_doc_id_dict_at, merge_dicts, range(DOCS), close=False)
             self.assertFalse(pool.closed())
-            result = pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs())
+            result = pool.mapreduce(word_to_doc_id_dict_at, merge_dicts, range(DOCS))
             self.assertTrue(pool.closed())
-            print("Finished in " + str(default_timer()-start) +
-                  "s using " + str(len(pool)) + " processes.")
-            self.assertDictEqual(result, result_reference)
+            self.assertDictEqual(result, result_reference())
 
         def test_pool_mapreduce_function_close(self):
             pool = mr4mp.pool(processes, close=False)
             self.assertFalse(pool.closed())
-            print("Starting.")
-            start = default_timer()
-            result = pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs(), close=False)
+            result = pool.mapreduce(word_to_doc_id_dict_at, merge_dicts, range(DOCS), close=False)
             self.assertFalse(pool.closed())
-            result = pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs(), close=True)
+            result = pool.mapreduce(word_to_doc_id_dict_at, merge_dicts, range(DOCS), close=True)
             self.assertTrue(pool.closed())
-            print("Finished in " + str(default_timer()-start) +
-                  "s using " + str(len(pool)) + " processes.")
-            self.assertDictEqual(result, result_reference)
+            self.assertDictEqual(result, result_reference())
 
         def test_pool_mapreduce_pool_open_reuse(self):
             pool = mr4mp.pool(processes, close=False)
-            result = pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs())
-            result = pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs())
-            result = pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs())
+            for _ in range(self.REUSE_COUNT):
+                result = pool.mapreduce(word_to_doc_id_dict_at, merge_dicts, range(DOCS))
             self.assertFalse(pool.closed())
             pool.close()
             self.assertTrue(pool.closed())
-            self.assertDictEqual(result, result_reference)
+            self.assertDictEqual(result, result_reference())
 
         def test_pool_mapreduce_pool_close_reuse_exception(self):
             pool = mr4mp.pool(processes, close=True)
-            pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs())
+            pool.mapreduce(word_to_doc_id_dict_at, merge_dicts, range(DOCS))
             with self.assertRaises(ValueError):
-                pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs())
+                pool.mapreduce(word_to_doc_id_dict_at, merge_dicts, range(DOCS))
 
         def test_pool_mapreduce_function_close_reuse_exception(self):
             pool = mr4mp.pool(processes, close=False)
-            pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs(), close=True)
+            pool.mapreduce(word_to_doc_id_dict_at, merge_dicts, range(DOCS), close=True)
             with self.assertRaises(ValueError):
-                pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs())
+                pool.mapreduce(word_to_doc_id_dict_at, merge_dicts, range(DOCS))
+
+        def test_pool_mapreduce_terminate_reuse_exception(self):
+            pool = mr4mp.pool(processes)
+            pool.terminate()
+            self.assertTrue(pool.closed())
+            with self.assertRaises(ValueError):
+                pool.mapreduce(word_to_doc_id_dict_at, merge_dicts, range(DOCS))
+
+        def test_pool_mapreduce_many(self):
+            pool = mr4mp.pool(processes, close=True)
+            results = pool.mapreduce_many(
+                [(word_to_doc_id_dict_at, merge_dicts, range(DOCS))] * self.REUSE_COUNT
+            )
+            self.assertTrue(pool.closed())
+            self.assertEqual(len(results), self.REUSE_COUNT)
+            for result in results:
+                self.assertDictEqual(result, result_reference())
 
         def test_pool_mapreduce_many_with_as(self):
             with mr4mp.pool(processes) as pool:
-                result = pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs())
-                result = pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs())
-                result = pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs())
+                for _ in range(self.REUSE_COUNT):
+                    result = pool.mapreduce(word_to_doc_id_dict_at, merge_dicts, range(DOCS))
                 self.assertFalse(pool.closed())
-            self.assertDictEqual(result, result_reference)
+            self.assertDictEqual(result, result_reference())
 
     return Test_pool_close
 
@@ -161,23 +265,38 @@ def define_class_pool_stages_progress(processes, stages, progress):
         # pylint: disable=missing-function-docstring
         def test_pool_mapreduce(self):
             logger = log() if progress else None
-            pool = mr4mp.pool(processes, close=True)
+            pool = cached_pool(processes)
             result = pool.mapreduce(
-                word_to_doc_id_dict, merge_dicts, docs(),
+                word_to_doc_id_dict_at, merge_dicts, range(DOCS),
                 stages=stages, progress=logger
             )
-            self.assertDictEqual(result, result_reference)
+            self.assertDictEqual(result, result_reference())
+            if progress:
+                self.assertEqual(
+                    logger.to_list(),
+                    list(range(DOCS)) if stages is not None else []
+                )
+
+        def test_pool_mapreduce_unordered(self):
+            # The merge operation is commutative, so results can be combined as they arrive.
+            logger = log() if progress else None
+            pool = cached_pool(processes)
+            result = pool.mapreduce(
+                word_to_doc_id_dict_at, merge_dicts, range(DOCS),
+                stages=stages, progress=logger, ordered=False
+            )
+            self.assertDictEqual(result, result_reference())
             if progress:
                 self.assertEqual(
                     logger.to_list(),
-                    docs() if stages is not None else []
+                    list(range(DOCS)) if stages is not None else []
                 )
 
         def test_pool_mapconcat(self):
             logger = log() if progress else None
-            pool = mr4mp.pool(processes, close=True)
+            pool = cached_pool(processes)
             result = pool.mapconcat(add_one, range(0, 100), stages=stages, progress=logger)
-            self.assertEqual(list(result), list(range(1, 101)))
+            self.assertEqual(tuple(result), add_one_reference)
             if progress:
                 self.assertEqual(
                     logger.to_list(),
@@ -196,26 +315,49 @@ def define_class_functions(processes, stages, progress):
         Tests of one-shot functions for executing workflows.
         """
         # pylint: disable=missing-function-docstring
+        def test_mapreduce_cache_pool(self):
+            mr4mp.configure(cache_pool=True)
+            for _ in range(2):
+                result = mr4mp.mapreduce(
+                    word_to_doc_id_dict_at, merge_dicts, range(DOCS),
+                    processes=processes, stages=stages
+                )
+                self.assertDictEqual(result, result_reference())
+            mr4mp.shutdown()
+            result = mr4mp.mapreduce(
+                word_to_doc_id_dict_at, merge_dicts, range(DOCS),
+                processes=processes, stages=stages
+            )
+            self.assertDictEqual(result, result_reference())
+            mr4mp.configure(cache_pool=False)
+
         def test_mapreduce(self):
             logger = log() if progress else None
             result = mr4mp.mapreduce(
-                word_to_doc_id_dict, merge_dicts, docs(),
+                word_to_doc_id_dict_at, merge_dicts, range(DOCS),
                 processes=processes, stages=stages, progress=logger
             )
-            self.assertDictEqual(result, result_reference)
+            self.assertDictEqual(result, result_reference())
             if progress:
                 self.assertEqual(
                     logger.to_list(),
-                    docs() if stages is not None else []
+                    list(range(DOCS)) if stages is not None else []
                 )
 
+        def test_mapreduce_merge_dict_of_sets(self):
+            result = mr4mp.mapreduce(
+                word_to_doc_id_dict_at, mr4mp.merge_dict_of_sets, range(DOCS),
+                processes=processes, stages=stages
+            )
+            self.assertDictEqual(result, result_reference())
+
         def test_mapconcat(self):
             logger = log() if progress else None
             result = mr4mp.mapconcat(
                 add_one, range(0, 100),
                 processes=processes, stages=stages, progress=logger
             )
-            self.assertEqual(list(result), list(range(1, 101)))
+            self.assertEqual(tuple(result), add_one_reference)
             if progress:
                 self.assertEqual(
                     logger.to_list(),
@@ -228,49 +370,236 @@ class Test_pool(TestCase):
     """
     Tests of resource pool instance methods.
     """
-    # pylint: disable=missing-function-docstring
+    # pylint: disable=missing-function-docstring,too-many-public-methods
     def test_pool_cpu_count(self):
         pool = mr4mp.pool()
-        self.assertEqual(pool.cpu_count(), mp.cpu_count())
-        self.assertEqual(len(pool), mp.cpu_count())
+        self.assertEqual(pool.cpu_count(), cpu_count())
+        self.assertEqual(len(pool), cpu_count())
         pool.close()
 
+    def test_pool_cpu_count_affinity(self):
+        # The number of CPUs is determined anew after the CPU affinity changes.
+        if hasattr(os, 'sched_getaffinity'):
+            cpus = os.sched_getaffinity(0)
+            mr4mp.pool().close()
+            try:
+                os.sched_setaffinity(0, {min(cpus)})
+                pool = mr4mp.pool()
+                self.assertEqual(len(pool), 1)
+                pool.close()
+            finally:
+                os.sched_setaffinity(0, cpus)
+
     def test_pool_init_negative(self):
         pool = mr4mp.pool(-1)
-        self.assertEqual(len(pool), mp.cpu_count() - 1)
+        self.assertEqual(len(pool), cpu_count() - 1)
         pool.close()
 
     def test_pool_mapreduce(self):
         pool = mr4mp.pool(close=True)
-        print("Starting.")
-        start = default_timer()
         result = pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs())
-        print("Finished in " + str(default_timer()-start) +
-              "s using " + str(len(pool)) + " processes.")
-        self.assertDictEqual(result, result_reference)
+        self.assertDictEqual(result, result_reference())
 
     def test_pool_mapreduce_terminate(self):
         pool = mr4mp.pool()
-        print("Starting.")
-        start = default_timer()
         result = pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs())
-        print("Finished in " + str(default_timer()-start) +
-              "s using " + str(len(pool)) + " processes.")
-        self.assertDictEqual(result, result_reference)
+        self.assertDictEqual(result, result_reference())
         pool.terminate()
         self.assertTrue(pool.closed())
 
-# The instantiated test classes below are discovered in the local scope
-# and executed by the unit testing framework (e.g., using nosetests).
-for _processes in (1, 2):
-    locals()['Test_pool_close_' + str(_processes)] = define_class_pool_close(_processes)
-    for _stages in (None, 4):
-        for _progress in (False, True):
-            locals()[
-                'Test_pool_stages_progress_' +\
-                "_".join(map(str, [_processes, _stages, _progress]))
-            ] = define_class_pool_stages_progress(_processes, _stages, _progress)
-            locals()[
-                'Test_functions_' +\
-                "_".join(map(str, [_processes, _stages, _progress]))
-            ] = define_class_functions(_processes, _stages, _progress)
+    def test_pool_mapreduce_unsliceable(self):
+        for (data, total) in (
+            ((x for x in range(-50, 50)), 2500),
+            (set(range(-50, 50)), 2500),
+            (deque(range(-50, 50)), 2500),
+            (dict.fromkeys(range(-2, 3)), 6)
+        ):
+            pool = mr4mp.pool(2, close=True)
+            self.assertEqual(pool.mapreduce(abs, add, data), total)
+
+    def test_pool_mapreduce_shared(self):
+        for data in (bytes(range(256)), array('l', range(-50, 50)), list(range(-50, 50))):
+            for stages in (None, 3):
+                pool = mr4mp.pool(2, close=True, shared=True)
+                result = pool.mapreduce(abs, add, data, stages=stages)
+                self.assertEqual(result, sum(map(abs, data)))
+
+    def test_pool_mapreduce_shared_unsupported(self):
+        # Inputs whose buffers cannot be shared are pickled part by part instead.
+        inputs = [(ctypes.c_int16 * 100)(*range(-50, 50))]
+        try: # NumPy is not a dependency, so arrays of dates are only tested if it is present.
+            inputs.append(import_module('numpy').arange(-50, 50).astype('timedelta64[s]'))
+        except ImportError: # pragma: no cover
+            pass
+
+        for data in inputs:
+            pool = mr4mp.pool(2, close=True, shared=True)
+            self.assertEqual(pool.mapreduce(abs, add, data), reduce(add, map(abs, data)))
+
+    def test_pool_mapreduce_shared_failure(self):
+        blocks = shared_memory_blocks()
+        pool = mr4mp.pool(2, close=True, shared=True)
+        with self.assertRaises(ValueError):
+            pool.mapreduce(abs_nonzero, add, array('l', range(-50, 50)), stages=4)
+        self.assertEqual(shared_memory_blocks(), blocks)
+
+    def test_pool_mapreduce_failure_in_process(self):
+        # Stages that follow a failed stage are not run within this process.
+        calls = []
+        def abs_nonzero_logged(x):
+            calls.append(x)
+            return abs_nonzero(x)
+
+        for (processes, min_parallel) in ((1, None), (2, 100)):
+            calls.clear()
+            pool = mr4mp.pool(processes, close=True, min_parallel=min_parallel)
+            with self.assertRaises(ValueError):
+                pool.mapreduce(abs_nonzero_logged, add, range(40), stages=4)
+            self.assertEqual(calls, [0])
+
+    def test_pool_mapreduce_many_failure_in_process(self):
+        # Workflows that follow a failed workflow are not run within this process.
+        calls = []
+        def abs_nonzero_logged(x):
+            calls.append(x)
+            return abs_nonzero(x)
+
+        for (processes, min_parallel) in ((1, None), (2, 100)):
+            calls.clear()
+            pool = mr4mp.pool(processes, close=True, min_parallel=min_parallel)
+            with self.assertRaises(ValueError):
+                pool.mapreduce_many([
+                    (abs_nonzero_logged, add, range(0, 10)),
+                    (abs_nonzero_logged, add, range(10, 20))
+                ])
+            self.assertEqual(calls, [0])
+
+    def test_pool_mapreduce_many_shared_failure(self):
+        blocks = shared_memory_blocks()
+        pool = mr4mp.pool(2, close=True, shared=True)
+        with self.assertRaises(ValueError):
+            pool.mapreduce_many([
+                (abs_nonzero, add, array('l', range(-50, 50))),
+                (abs_nonzero, add, array('l', range(1, 100)))
+            ])
+        self.assertEqual(shared_memory_blocks(), blocks)
+
+    def test_pool_mapreduce_batch_size(self):
+        for batch_size in (1, 7, 1000):
+            pool = mr4mp.pool(2, close=True, batch_size=batch_size)
+            result = pool.mapconcat(add_one, range(0, 100))
+            self.assertEqual(tuple(result), add_one_reference)
+
+    def test_pool_mapreduce_chunksize(self):
+        for chunksize in (1, 3, 100):
+            pool = mr4mp.pool(2, close=True, batch_size=5, chunksize=chunksize)
+            result = pool.mapconcat(add_one, range(0, 100))
+            self.assertEqual(tuple(result), add_one_reference)
+
+        # One document per part, with parts handed to workers in clumps.
+        for processes in (1, 2):
+            pool = mr4mp.pool(
+                processes, close=True, batch_size=1,
+                chunksize=max(1, DOCS // (processes + 2))
+            )
+            result = pool.mapreduce(word_to_doc_id_dict_at, merge_dicts, range(DOCS))
+            self.assertDictEqual(result, result_reference())
+
+    def test_pool_mapreduce_parts(self):
+        # Each part is counted once (by applying the map operation to whole parts).
+        for (batch_size, quantity) in ((None, 8), (10, 10), (1000, 2)):
+            pool = mr4mp.pool(2, close=True, batch_size=batch_size, vectorize=True)
+            self.assertEqual(pool.mapreduce(bool, add, list(range(100))), quantity)
+
+    def test_pool_mapreduce_pin(self):
+        for processes in (1, 2, 3):
+            pool = mr4mp.pool(processes, close=True, pin=True)
+            result = pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs())
+            self.assertDictEqual(result, result_reference())
+
+        # Each worker is restricted to one CPU (where CPU affinity is supported).
+        if hasattr(os, 'sched_getaffinity'):
+            pool = mr4mp.pool(2, close=True, pin=True)
+            self.assertEqual(pool.mapreduce(cpus_allowed, max, range(8)), 1)
+
+    def test_pool_mapreduce_min_parallel(self):
+        for min_parallel in (None, 0, 50, 1000):
+            pool = mr4mp.pool(2, close=True, min_parallel=min_parallel)
+            result = pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs())
+            self.assertDictEqual(result, result_reference())
+
+        for processes in (1, 2):
+            self.assertEqual(mr4mp.mapreduce(abs, add, [-3], processes=processes), 3)
+            with mr4mp.pool(processes) as pool:
+                self.assertEqual(pool.mapreduce(abs, add, [-3]), 3)
+
+    def test_pool_mapreduce_start_method(self):
+        for start_method in mp.get_all_start_methods():
+            pool = mr4mp.pool(2, close=True, start_method=start_method)
+            self.assertEqual(pool.mapreduce(abs, add, range(-50, 50)), 2500)
+
+    def test_pool_mapreduce_vectorize(self):
+        for (processes, shared, stages) in product((1, 2), (False, True), (None, 3)):
+            pool = mr4mp.pool(processes, close=True, shared=shared, vectorize=True)
+            result = pool.mapreduce(sum, add, array('l', range(100)), stages=stages)
+            self.assertEqual(result, 4950)
+
+    def test_mapreduce_vectorize(self):
+        for (processes, stages) in product((1, 2), (None, 3)):
+            result = mr4mp.mapreduce(
+                sum, add, array('l', range(100)),
+                processes=processes, stages=stages, vectorize=True
+            )
+            self.assertEqual(result, 4950)
+
+    def test_pool_mapreduce_unordered(self):
+        for (batch_size, stages) in product((None, 3), (None, 4)):
+            pool = mr4mp.pool(2, close=True, batch_size=batch_size)
+            result = pool.mapreduce(
+                word_to_doc_id_dict, merge_dicts, docs(),
+                stages=stages, ordered=False
+            )
+            self.assertDictEqual(result, result_reference())
+
+    def test_pool_mapreduce_progress_length(self):
+        lengths = []
+        def progress(xss):
+            lengths.append(len(xss))
+            return xss
+
+        for processes in (1, 2):
+            result = mr4mp.mapreduce(
+                word_to_doc_id_dict, merge_dicts, docs(),
+                processes=processes, stages=4, progress=progress
+            )
+            self.assertDictEqual(result, result_reference())
+        self.assertEqual(lengths, [4, 4])
+
+    def test_pool_mapreduce_tree(self):
+        pool = mr4mp.pool(5, close=True, tree=True)
+        result = pool.mapconcat(add_one, range(0, 100))
+        self.assertEqual(tuple(result), add_one_reference)
+        pool = mr4mp.pool(5, close=True, tree=True)
+        result = pool.mapreduce(word_to_doc_id_dict, merge_dicts, docs())
+        self.assertDictEqual(result, result_reference())
+
+# The instantiated test classes below are discovered in the module scope and
+# executed by the unit testing framework (e.g., using pytest).
+Test_pool_close_1 = define_class_pool_close(1)
+Test_pool_close_2 = define_class_pool_close(2)
+Test_pool_stages_progress_1_none_false = define_class_pool_stages_progress(1, None, False)
+Test_pool_stages_progress_1_none_true = define_class_pool_stages_progress(1, None, True)
+Test_pool_stages_progress_1_4_false = define_class_pool_stages_progress(1, 4, False)
+Test_pool_stages_progress_1_4_true = define_class_pool_stages_progress(1, 4, True)
+Test_pool_stages_progress_2_none_false = define_class_pool_stages_progress(2, None, False)
+Test_pool_stages_progress_2_none_true = define_class_pool_stages_progress(2, None, True)
+Test_pool_stages_progress_2_4_false = define_class_pool_stages_progress(2, 4, False)
+Test_pool_stages_progress_2_4_true = define_class_pool_stages_progress(2, 4, True)
+Test_functions_1_none_false = define_class_functions(1, None, False)
+Test_functions_1_none_true = define_class_functions(1, None, True)
+Test_functions_1_4_false = define_class_functions(1, 4, False)
+Test_functions_1_4_true = define_class_functions(1, 4, True)
+Test_functions_2_none_false = define_class_functions(2, None, False)
+Test_functions_2_none_true = define_class_functions(2, None, True)
+Test_functions_2_4_false = define_class_functions(2, 4, False)
+Test_functions_2_4_true = define_class_functions(2, 4, True)